@@ -1,6 +1,9 @@
 # ABOUTME: FastAPI application factory with middleware and exception handlers.
 # ABOUTME: Creates and configures the Link Content Scraper web application.
+import atexit
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -11,6 +14,31 @@ from fastapi.staticfiles import StaticFiles
 from . import config as _config
 from .config import LOG_LEVEL
 from .routes import router
+from .scraper import close_http_client
+
+
+def _configure_logging() -> None:
+    """Send log records through a queue to a background writer thread.
+
+    The stderr write and the final formatter pass then happen off the event
+    loop. Message interpolation and traceback rendering still run on the
+    calling thread, since QueueHandler.prepare() formats each record before
+    queueing it. Like logging.basicConfig, does nothing if the root logger
+    already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    listener.start()
+    atexit.register(listener.stop)  # Flush anything still queued on exit
 
 
 @asynccontextmanager
@@ -30,13 +58,11 @@ async def _lifespan(app: FastAPI):
             f"Required environment variables not set: {', '.join(missing)} — refusing to start"
         )
     yield
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
-    logging.basicConfig(
-        level=getattr(logging, LOG_LEVEL, logging.INFO),
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
+    _configure_logging()
 
     if _config.SENTRY_DSN:
         try:
@@ -26,18 +26,33 @@ RATE_LIMIT: int = _int_env("SCRAPER_RATE_LIMIT", 15)  # Reduce to 15 to be safer
 RATE_PERIOD: int = _int_env("SCRAPER_RATE_PERIOD", 60)  # seconds
 MAX_RETRIES: int = _int_env("SCRAPER_MAX_RETRIES", 3)
 RETRY_DELAY: int = _int_env("SCRAPER_RETRY_DELAY", 5)  # seconds between retries
+MAX_RETRY_DELAY: float = _float_env("SCRAPER_MAX_RETRY_DELAY", 30.0)  # Cap on any single retry wait
 PDF_TIMEOUT: float = _float_env("SCRAPER_PDF_TIMEOUT", 60.0)  # Longer timeout for PDFs
 DEFAULT_TIMEOUT: float = _float_env("SCRAPER_DEFAULT_TIMEOUT", 30.0)  # Default timeout for other content
-BATCH_SIZE: int = _int_env("SCRAPER_BATCH_SIZE", 10)
+MAX_CONCURRENCY: int = _int_env("SCRAPER_MAX_CONCURRENCY", 10)  # In-flight fetches per job
+MAX_CONTENT_BYTES: int = _int_env("SCRAPER_MAX_CONTENT_BYTES", 10 * 1024 * 1024)  # Per-page body cap
+
+# Shared HTTP connection pool
+MAX_CONNECTIONS: int = _int_env("SCRAPER_MAX_CONNECTIONS", 100)
+MAX_KEEPALIVE_CONNECTIONS: int = _int_env("SCRAPER_MAX_KEEPALIVE_CONNECTIONS", 20)
+KEEPALIVE_EXPIRY: float = _float_env("SCRAPER_KEEPALIVE_EXPIRY", 60.0)  # seconds
 
 # Title extraction & filenames
 MAX_TITLE_SEARCH_LINES: int = _int_env("SCRAPER_MAX_TITLE_SEARCH_LINES", 30)
+MAX_TITLE_SEARCH_CHARS: int = _int_env("SCRAPER_MAX_TITLE_SEARCH_CHARS", 4096)
 MIN_TITLE_LENGTH: int = _int_env("SCRAPER_MIN_TITLE_LENGTH", 3)
 MAX_FILENAME_LENGTH: int = _int_env("SCRAPER_MAX_FILENAME_LENGTH", 100)
 URL_HASH_LENGTH: int = _int_env("SCRAPER_URL_HASH_LENGTH", 12)
 
+# ZIP output: "deflate" (readable everywhere) or "zstd" (Python 3.14+ only;
+# falls back to deflate elsewhere, and needs a zstd-aware unzip tool)
+ZIP_COMPRESSION: str = os.environ.get("SCRAPER_ZIP_COMPRESSION", "deflate").lower()
+# Compression level for ZIP entries; 1 favours speed, markdown compresses well anyway
+ZIP_COMPRESSLEVEL: int = _int_env("SCRAPER_ZIP_COMPRESSLEVEL", 1)
+
 # Cleanup
 CLEANUP_DELAY_SECONDS: int = _int_env("SCRAPER_CLEANUP_DELAY", 300)
+RESULT_TTL_SECONDS: int = _int_env("SCRAPER_RESULT_TTL", 3600)  # Undownloaded results expire
 
 # Logging
 LOG_LEVEL: str = os.environ.get("SCRAPER_LOG_LEVEL", "INFO").upper()
@@ -1,61 +1,107 @@
 # ABOUTME: Title extraction, filename generation, and content validation utilities.
 # ABOUTME: Processes Jina API markdown output into safe filenames for ZIP packaging.
+import functools
 import hashlib
 import logging
 import re
 import unicodedata
 from typing import Optional
 
-from .config import MAX_TITLE_SEARCH_LINES, MIN_TITLE_LENGTH, MAX_FILENAME_LENGTH, URL_HASH_LENGTH
+from .config import (
+    MAX_FILENAME_LENGTH,
+    MAX_TITLE_SEARCH_CHARS,
+    MAX_TITLE_SEARCH_LINES,
+    MIN_TITLE_LENGTH,
+    URL_HASH_LENGTH,
+)
 
 logger = logging.getLogger(__name__)
 
 METADATA_PREFIXES = ("# Original URL:", "Title:", "URL Source:", "Markdown Content:", "Published:")
 
+# A non-blank line that isn't one of Jina's metadata headers
+_BODY_LINE_RE = re.compile(
+    r'^(?!' + '|'.join(map(re.escape, METADATA_PREFIXES)) + r')[^\n]*\S',
+    re.MULTILINE,
+)
+
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+_EMPHASIS_RE = re.compile(r'[*_`]')
+# Slug table for ASCII text: word characters and '-' are kept, whitespace
+# becomes '-', everything else is dropped. Dash runs are collapsed afterwards.
+_SLUG_TABLE = str.maketrans({
+    chr(c): ('-' if chr(c).isspace() else None)
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in '_-')
+})
+_DASH_RUN_RE = re.compile(r'-{2,}')
+
+# Candidate title lines: "Title: ...", an H1 (other than our own
+# "# Original URL:" header), or an H2. Leading whitespace is ignored.
+_TITLE_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:Title:(?P<meta>.*)|# (?!Original URL:)(?P<h1>.*)|## (?P<h2>.*))$',
+    re.MULTILINE,
+)
+
 
 def _clean_title(title: str) -> str:
     """Remove markdown link and emphasis formatting from a title string."""
-    title = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', title)  # Remove links
-    title = re.sub(r'[*_`]', '', title)  # Remove emphasis markers
+    title = _MD_LINK_RE.sub(r'\1', title)  # Remove links
+    title = _EMPHASIS_RE.sub('', title)  # Remove emphasis markers
     return title.strip()
 
 
+def _head(content: str, max_lines: int, max_chars: int) -> str:
+    """Return the first ``max_lines`` lines of content, capped at ``max_chars``.
+
+    Never looks past ``max_chars``, so a huge document with few newlines
+    (e.g. extracted PDF text) isn't scanned end to end.
+    """
+    end = -1
+    for _ in range(max_lines):
+        end = content.find('\n', end + 1, max_chars)
+        if end == -1:
+            return content[:max_chars]
+    return content[:end]
+
+
 def extract_title_from_content(content: str) -> Optional[str]:
     """Extract a human-readable title from Jina-returned markdown.
 
-    Searches the first MAX_TITLE_SEARCH_LINES for an H1, a "Title:" line,
-    or (as fallback) an H2 header.
+    Searches the first MAX_TITLE_SEARCH_LINES (at most MAX_TITLE_SEARCH_CHARS)
+    for an H1, a "Title:" line, or (as fallback) an H2 header.
     """
     if not content:
         return None
 
-    lines = content.split('\n')
-
-    for line in lines[:MAX_TITLE_SEARCH_LINES]:
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith(METADATA_PREFIXES):
+    fallback = None
+    for match in _TITLE_LINE_RE.finditer(_head(content, MAX_TITLE_SEARCH_LINES, MAX_TITLE_SEARCH_CHARS)):
+        meta, h1, h2 = match.group('meta', 'h1', 'h2')
+        if meta is not None:
             # Sometimes title is in format "Title: Some Title"
-            if line.startswith('Title:') and len(line) > 7:
-                title = line[6:].strip()
-                if title:
-                    return title
-            continue
-        if line.startswith('# ') and len(line) > 2:
-            title = _clean_title(line[2:])
-            if title and len(title) > MIN_TITLE_LENGTH:
+            title = meta.strip()
+            if title:
                 return title
-
-    # Fallback: look for H2
-    for line in lines[:MAX_TITLE_SEARCH_LINES]:
-        line = line.strip()
-        if line.startswith('## ') and len(line) > 3:
-            title = _clean_title(line[3:])
-            if title and len(title) > MIN_TITLE_LENGTH:
+        elif h1 is not None:
+            title = _clean_title(h1)
+            if len(title) > MIN_TITLE_LENGTH:
                 return title
+        elif fallback is None:
+            title = _clean_title(h2)
+            if len(title) > MIN_TITLE_LENGTH:
+                fallback = title
+
+    return fallback
+
 
-    return None
+@functools.lru_cache(maxsize=4096)
+def _ascii_fold(text: str) -> str:
+    """Decompose accented characters and drop whatever isn't ASCII.
+
+    Cached because the same titles recur across the pages of a site.
+    """
+    normalized = unicodedata.normalize('NFKD', text)
+    return normalized.encode('ascii', 'ignore').decode('ascii')
 
 
 def create_safe_filename(title: Optional[str], url: str, max_length: int = MAX_FILENAME_LENGTH) -> str:
@@ -69,10 +115,9 @@ def create_safe_filename(title: Optional[str], url: str, max_length: int = MAX_F
         # Fallback to URL hash if no title
         return f"{url_hash}.md"
 
-    normalized = unicodedata.normalize('NFKD', title)
-    ascii_title = normalized.encode('ascii', 'ignore').decode('ascii')
-    safe_chars = re.sub(r'[^\w\s-]', '', ascii_title)
-    safe_chars = re.sub(r'[-\s]+', '-', safe_chars).strip('-')
+    # Most titles are plain ASCII already, and NFKD leaves ASCII untouched
+    ascii_title = title if title.isascii() else _ascii_fold(title)
+    safe_chars = _DASH_RUN_RE.sub('-', ascii_title.translate(_SLUG_TABLE)).strip('-')
 
     if len(safe_chars) > max_length:
         safe_chars = safe_chars[:max_length].rstrip('-')
@@ -87,7 +132,4 @@ def is_content_valid(content: str) -> bool:
     """Return True if scraped content has real substance (not just metadata)."""
     if not content or len(content.strip()) < 50 or content.count('\n') < 3:
         return False
-    lines = content.split('\n')
-    return not all(
-        line.startswith(METADATA_PREFIXES) for line in lines if line.strip()
-    )
+    return _BODY_LINE_RE.search(content) is not None
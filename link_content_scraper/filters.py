@@ -5,44 +5,38 @@ import re
 
 logger = logging.getLogger(__name__)
 
-_SKIP_PATTERNS = [
-    re.compile(p) for p in [
-        r'\.png$', r'\.jpg$', r'\.jpeg$', r'\.gif$', r'\.webp$',
-        r'twitter\.com', r'x\.com',
-        r'linkedin\.com',
-        r'facebook\.com',
-        r'instagram\.com',
-        r'youtube\.com',
-        r'substackcdn\.com',
-    ]
-]
-
-_ARXIV_PATTERNS = [
-    re.compile(p) for p in [
-        r'arxiv\.org/abs/(\d+\.\d+)(v\d+)?',
-        r'arxiv\.org/pdf/(\d+\.\d+)(v\d+)?\.pdf',
-        r'arxiv\.org/html/(\d+\.\d+)(v\d+)?',
-    ]
-]
+_SKIP_RE = re.compile(
+    r'\.(?:png|jpe?g|gif|webp)$'
+    r'|twitter\.com|x\.com'
+    r'|linkedin\.com'
+    r'|facebook\.com'
+    r'|instagram\.com'
+    r'|youtube\.com'
+    r'|substackcdn\.com',
+    re.IGNORECASE,
+)
+
+# abs/ and html/ URLs match on their own; pdf/ URLs only with the .pdf suffix.
+_ARXIV_RE = re.compile(
+    r'arxiv\.org/(?:(?:abs|html)/(\d+\.\d+)(v\d+)?|pdf/(\d+\.\d+)(v\d+)?\.pdf)'
+)
 
 
 def should_skip_url(url: str) -> bool:
     """Return True if the URL points to social media, images, or other non-article content."""
-    lower = url.lower()
-    return any(p.search(lower) for p in _SKIP_PATTERNS)
+    return _SKIP_RE.search(url) is not None
 
 
 def transform_arxiv_url(url: str) -> str:
     """Convert arXiv abstract/HTML URLs to their PDF equivalents for better extraction."""
-    for pattern in _ARXIV_PATTERNS:
-        match = pattern.search(url)
-        if match:
-            paper_id = match.group(1)
-            version = match.group(2) or ''
-            transformed = f"https://arxiv.org/pdf/{paper_id}{version}.pdf"
-            logger.info("Transformed arXiv URL: %s -> %s", url, transformed)
-            return transformed
-    return url
+    match = _ARXIV_RE.search(url)
+    if not match:
+        return url
+    paper_id = match.group(1) or match.group(3)
+    version = match.group(2) or match.group(4) or ''
+    transformed = f"https://arxiv.org/pdf/{paper_id}{version}.pdf"
+    logger.debug("Transformed arXiv URL: %s -> %s", url, transformed)
+    return transformed
 
 
 def is_pdf_url(url: str) -> bool:
@@ -2,10 +2,11 @@
 # ABOUTME: Owns result lookup, owner authorization, and delayed ZIP cleanup.
 import asyncio
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from .config import CLEANUP_DELAY_SECONDS
+from .config import CLEANUP_DELAY_SECONDS, RESULT_TTL_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,7 @@ class JobResult:
 
     zip_path: str
     customer_id: str
+    created_at: float = field(default_factory=time.monotonic, compare=False)
 
 
 class JobStore:
@@ -27,11 +29,16 @@ class JobStore:
     in the routes layer.
     """
 
-    def __init__(self, cleanup_delay: float = CLEANUP_DELAY_SECONDS) -> None:
+    def __init__(
+        self,
+        cleanup_delay: float = CLEANUP_DELAY_SECONDS,
+        result_ttl: float = RESULT_TTL_SECONDS,
+    ) -> None:
         self._results: dict[str, JobResult] = {}
         self._owners: dict[str, str] = {}
         self._lock = asyncio.Lock()
         self._cleanup_delay = cleanup_delay
+        self._result_ttl = result_ttl
         # Strong refs to background cleanup tasks so they aren't GC'd mid-run.
         self._background_tasks: set[asyncio.Task] = set()
 
@@ -55,9 +62,14 @@ class JobStore:
     # -- Results ---------------------------------------------------------------
 
     async def store_result(self, job_id: str, zip_path: str, customer_id: str) -> None:
-        """Record a completed job's downloadable ZIP and its owner."""
+        """Record a completed job's downloadable ZIP and its owner.
+
+        Also schedules the result's expiry after the TTL, so a job nobody
+        downloads doesn't keep its ZIP on disk forever.
+        """
         async with self._lock:
             self._results[job_id] = JobResult(zip_path=zip_path, customer_id=customer_id)
+        self.schedule_cleanup(job_id, zip_path, delay=self._result_ttl)
 
     async def get_result(self, job_id: str, customer_id: str) -> JobResult | None:
         """Return a job's result only if owned by ``customer_id``.
@@ -67,7 +79,7 @@ class JobStore:
         """
         async with self._lock:
             entry = self._results.get(job_id)
-        if entry is None or entry.customer_id != customer_id:
+        if entry is None or entry.customer_id != customer_id or self._is_expired(entry):
             return None
         return entry
 
@@ -75,23 +87,38 @@ class JobStore:
         async with self._lock:
             self._results.pop(job_id, None)
 
+    def _is_expired(self, entry: JobResult) -> bool:
+        return time.monotonic() - entry.created_at >= self._result_ttl
+
     # -- Cleanup ---------------------------------------------------------------
 
-    def schedule_cleanup(self, job_id: str, zip_path: str) -> asyncio.Task:
-        """Schedule deletion of a job's ZIP after the configured delay."""
-        task = asyncio.create_task(self._cleanup(job_id, zip_path))
+    def schedule_cleanup(
+        self, job_id: str, zip_path: str, delay: float | None = None
+    ) -> asyncio.Task:
+        """Schedule deletion of a job's ZIP after ``delay`` seconds.
+
+        Defaults to the configured post-download cleanup delay.
+        """
+        if delay is None:
+            delay = self._cleanup_delay
+        task = asyncio.create_task(self._cleanup(job_id, zip_path, delay))
         self._background_tasks.add(task)
         task.add_done_callback(self._background_tasks.discard)
         return task
 
-    async def _cleanup(self, job_id: str, zip_path: str) -> None:
-        await asyncio.sleep(self._cleanup_delay)
+    async def _cleanup(self, job_id: str, zip_path: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            self._unlink(zip_path)
+        finally:
+            await self._discard_result(job_id)
+
+    @staticmethod
+    def _unlink(zip_path: str) -> None:
         try:
             Path(zip_path).unlink(missing_ok=True)
         except OSError:
             logger.warning("Failed to clean up %s", zip_path)
-        finally:
-            await self._discard_result(job_id)
 
 
 # Singleton shared across the application.
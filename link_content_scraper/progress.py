@@ -1,15 +1,57 @@
 # ABOUTME: Async-safe progress tracking for scrape jobs with SSE event generation.
 # ABOUTME: Provides lock-protected counters and cancellation support for concurrent tasks.
 import asyncio
-import json
 import logging
+from dataclasses import dataclass, field, fields
 from typing import AsyncGenerator, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Max iterations to wait for a tracker to be initialized (at 0.5s each = 30s)
 _MAX_WAIT_ITERATIONS = 60
 
+# Re-send the current state this often even when nothing has changed, so
+# proxies and the browser keep the SSE connection open.
+_HEARTBEAT_SECONDS = 5.0
+
+
+def _sse(data: dict) -> bytes:
+    """Format a payload as a single SSE ``data:`` frame, ready to send."""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+@dataclass(slots=True)
+class JobProgress:
+    """Counters and control state for a single scrape job."""
+
+    total: int = 0
+    processed: int = 0
+    successful: int = 0
+    potential_successful: int = 0
+    skipped: int = 0
+    failed: int = 0
+    current_url: str = ""
+    cancelled: bool = False
+    tasks: list[asyncio.Task] = field(default_factory=list, repr=False)
+    # Bumped on every mutation. Each progress stream waits on ``changed``
+    # until the version passes the last one it sent, so several streams on
+    # one tracker can't consume each other's wake-ups.
+    version: int = field(default=0, repr=False)
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition, repr=False)
+
+    def snapshot(self) -> dict:
+        """Shallow plain-dict copy of the current state."""
+        return {name: getattr(self, name) for name in _FIELDS}
+
+
+_FIELDS = tuple(f.name for f in fields(JobProgress) if f.name not in ("version", "changed"))
+# Fields increment() may add to
+_COUNTER_FIELDS = frozenset(
+    {"total", "processed", "successful", "potential_successful", "skipped", "failed"}
+)
+
 
 class ProgressTracker:
     """Async-safe progress tracking for scrape jobs.
@@ -19,47 +61,45 @@ class ProgressTracker:
     """
 
     def __init__(self) -> None:
-        self._trackers: dict[str, dict] = {}
+        self._trackers: dict[str, JobProgress] = {}
         self._lock = asyncio.Lock()
 
-    def _default(self) -> dict:
-        return {
-            "total": 0,
-            "processed": 0,
-            "successful": 0,
-            "potential_successful": 0,
-            "skipped": 0,
-            "failed": 0,
-            "current_url": "",
-            "cancelled": False,
-            "tasks": [],
-        }
+    def _entry(self, tracker_id: str) -> JobProgress:
+        """Return the tracker's entry, creating it if needed (call under the lock)."""
+        t = self._trackers.get(tracker_id)
+        if t is None:
+            # The condition shares our lock, so mutations can notify directly
+            t = self._trackers[tracker_id] = JobProgress(changed=asyncio.Condition(self._lock))
+        return t
+
+    @staticmethod
+    def _touch(t: JobProgress) -> None:
+        """Record a change and wake every stream watching it (call under the lock)."""
+        t.version += 1
+        t.changed.notify_all()
 
     async def init(self, tracker_id: str, total: int, processed: int = 0) -> None:
         async with self._lock:
-            if tracker_id not in self._trackers:
-                self._trackers[tracker_id] = self._default()
-            t = self._trackers[tracker_id]
-            t["total"] = total
-            t["processed"] = processed
+            t = self._entry(tracker_id)
+            t.total = total
+            t.processed = processed
+            self._touch(t)
 
     async def update(self, tracker_id: str, **kwargs: object) -> None:
         async with self._lock:
-            if tracker_id not in self._trackers:
-                self._trackers[tracker_id] = self._default()
-            t = self._trackers[tracker_id]
+            t = self._entry(tracker_id)
             for key, value in kwargs.items():
-                if key in t:
-                    t[key] = value
+                if key in _FIELDS:
+                    setattr(t, key, value)
+            self._touch(t)
 
     async def increment(self, tracker_id: str, **kwargs: int) -> None:
         async with self._lock:
-            if tracker_id not in self._trackers:
-                self._trackers[tracker_id] = self._default()
-            t = self._trackers[tracker_id]
+            t = self._entry(tracker_id)
             for key, delta in kwargs.items():
-                if key in t and isinstance(t[key], int):
-                    t[key] += delta
+                if key in _COUNTER_FIELDS:
+                    setattr(t, key, getattr(t, key) + delta)
+            self._touch(t)
 
     async def get(self, tracker_id: str) -> Optional[dict]:
         """Return a snapshot of the tracker state, or None if it doesn't exist."""
@@ -67,14 +107,12 @@ class ProgressTracker:
             t = self._trackers.get(tracker_id)
             if t is None:
                 return None
-            return dict(t)
+            return t.snapshot()
 
     async def is_cancelled(self, tracker_id: str) -> bool:
         async with self._lock:
             t = self._trackers.get(tracker_id)
-            if t is None:
-                return False
-            return t.get("cancelled", False)
+            return t is not None and t.cancelled
 
     async def cancel(self, tracker_id: str) -> bool:
         """Mark a tracker as cancelled and cancel its running tasks.
@@ -82,49 +120,82 @@ class ProgressTracker:
         Returns True if the tracker existed and was cancelled.
         """
         async with self._lock:
-            if tracker_id not in self._trackers:
+            t = self._trackers.get(tracker_id)
+            if t is None:
                 return False
-            t = self._trackers[tracker_id]
-            t["cancelled"] = True
-            for task in t.get("tasks", []):
+            t.cancelled = True
+            self._touch(t)
+            for task in t.tasks:
                 if not task.done():
                     task.cancel()
             return True
 
     async def register_tasks(self, tracker_id: str, tasks: list[asyncio.Task]) -> None:
         async with self._lock:
-            if tracker_id not in self._trackers:
-                self._trackers[tracker_id] = self._default()
-            self._trackers[tracker_id]["tasks"].extend(tasks)
+            self._entry(tracker_id).tasks.extend(tasks)
 
     async def remove(self, tracker_id: str) -> dict:
         async with self._lock:
-            return self._trackers.pop(tracker_id, {})
+            t = self._trackers.pop(tracker_id, None)
+            if t is None:
+                return {}
+            self._touch(t)  # Wake any progress stream so it sees the removal
+            return t.snapshot()
+
+    async def _wait_for_tracker(self, tracker_id: str) -> Optional[JobProgress]:
+        """Return the tracker's entry, waiting up to _MAX_WAIT_ITERATIONS for it.
+
+        The SSE stream often opens before the scrape POST initializes the
+        tracker, so a missing tracker isn't an error straight away.
+        """
+        waited = 0
+        while True:
+            async with self._lock:
+                t = self._trackers.get(tracker_id)
+            if t is not None or waited >= _MAX_WAIT_ITERATIONS:
+                return t
+            waited += 1
+            await asyncio.sleep(0.5)
+
+    async def _next_state(
+        self, tracker_id: str, t: JobProgress, seen_version: int
+    ) -> tuple[dict, int, bool]:
+        """Wait for ``t`` to move past ``seen_version``, then snapshot it.
+
+        Gives up waiting after _HEARTBEAT_SECONDS. Returns the snapshot, its
+        version, and whether the tracker is still registered.
+        """
+        async with self._lock:
+            try:
+                await asyncio.wait_for(
+                    t.changed.wait_for(lambda: t.version != seen_version),
+                    timeout=_HEARTBEAT_SECONDS,
+                )
+            except TimeoutError:
+                pass
+            return t.snapshot(), t.version, self._trackers.get(tracker_id) is t
 
     async def exists(self, tracker_id: str) -> bool:
         async with self._lock:
             return tracker_id in self._trackers
 
-    async def generate_events(self, tracker_id: str) -> AsyncGenerator[str, None]:
+    async def generate_events(self, tracker_id: str) -> AsyncGenerator[bytes, None]:
         """Yield SSE-formatted progress events until processing is complete or cancelled.
 
-        Terminates gracefully if the tracker is unknown or gets removed.
+        A new event is sent whenever the tracker changes, plus a heartbeat
+        every _HEARTBEAT_SECONDS. Terminates gracefully if the tracker is
+        unknown or gets removed.
         """
-        waited = 0
+        t = await self._wait_for_tracker(tracker_id)
+        if t is None:
+            # Give up after waiting too long — notify the client
+            yield _sse({"error": "Progress tracker not found. The job may have failed to start."})
+            return
+
+        version = -1  # Nothing sent yet, so the first snapshot goes out at once
+        sent = None
         while True:
-            state = await self.get(tracker_id)
-
-            # Tracker doesn't exist (yet or any more)
-            if state is None:
-                if waited < _MAX_WAIT_ITERATIONS:
-                    # May not be created yet — the SSE stream often opens
-                    # before the scrape POST initializes the tracker
-                    waited += 1
-                    await asyncio.sleep(0.5)
-                    continue
-                # Give up after waiting too long — notify the client
-                yield f'data: {json.dumps({"error": "Progress tracker not found. The job may have failed to start."})}\n\n'
-                return
+            state, version, live = await self._next_state(tracker_id, t, version)
 
             if state["cancelled"]:
                 data = {
@@ -136,35 +207,31 @@ class ProgressTracker:
                     "current_url": "",
                     "cancelled": True,
                 }
-                yield f"data: {json.dumps(data)}\n\n"
+                yield _sse(data)
                 return
 
-            if state["processed"] >= state["total"] and state["total"] > 0:
-                break
-
-            data = {
-                "total": state["total"],
-                "processed": state["processed"],
-                "successful": state["potential_successful"],
-                "skipped": state["skipped"],
-                "failed": state["failed"],
-                "current_url": state["current_url"],
-            }
-            yield f"data: {json.dumps(data)}\n\n"
-            await asyncio.sleep(0.5)
-
-        # Final update with confirmed successes
-        state = await self.get(tracker_id)
-        if state is not None:
+            done = state["processed"] >= state["total"] and state["total"] > 0
             data = {
                 "total": state["total"],
                 "processed": state["processed"],
-                "successful": state["successful"],
+                # Confirmed successes once the job is complete
+                "successful": state["successful"] if done else state["potential_successful"],
                 "skipped": state["skipped"],
                 "failed": state["failed"],
                 "current_url": state["current_url"],
             }
-            yield f"data: {json.dumps(data)}\n\n"
+            frame = _sse(data)
+            if done:
+                yield frame
+                return
+            if not live:
+                # Removed once the job finished or failed — report its last
+                # state if this stream hadn't sent it yet, then stop
+                if frame != sent:
+                    yield frame
+                return
+            yield frame
+            sent = frame
 
 
 # Singleton instance shared across the application
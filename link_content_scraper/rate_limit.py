@@ -2,6 +2,7 @@
 # ABOUTME: Tracks request timestamps and sleeps when the rate window is full.
 import asyncio
 import time
+from collections import deque
 
 from .config import RATE_LIMIT, RATE_PERIOD
 
@@ -10,23 +11,26 @@ class RateLimiter:
     """Async-safe timestamp-based rate limiter.
 
     Tracks timestamps of recent requests and sleeps when the window is full.
-    The lock is released during sleep so other coroutines aren't blocked.
+    Timestamps come from the monotonic clock, oldest first, so expired ones
+    are evicted from the left. The lock is released during sleep so other
+    coroutines aren't blocked.
     """
 
     def __init__(self, limit: int = RATE_LIMIT, period: int = RATE_PERIOD):
         self._limit = limit
         self._period = period
-        self._timestamps: list[float] = []
+        self._timestamps: deque[float] = deque()
         self._lock = asyncio.Lock()
 
     async def acquire(self) -> None:
         while True:
             async with self._lock:
-                now = time.time()
-                self._timestamps = [t for t in self._timestamps if now - t < self._period]
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self._period:
+                    self._timestamps.popleft()
 
                 if len(self._timestamps) < self._limit:
-                    self._timestamps.append(time.time())
+                    self._timestamps.append(now)
                     return
 
                 # Calculate how long to wait, but release lock before sleeping
@@ -3,7 +3,6 @@
 import hashlib
 import logging
 import secrets
-from pathlib import Path
 from urllib.parse import quote
 from uuid import uuid4
 
@@ -15,6 +14,7 @@ from .. import config as _config
 from ..auth import Customer, db_client, require_api_key
 from ..billing import create_checkout_session, create_portal_session, handle_webhook
 from ..config import TIER_LIMITS, current_usage_month
+from .pages import load_page
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +32,12 @@ class FreeSignupRequest(BaseModel):
 
 @router.get("/billing", response_class=HTMLResponse)
 async def billing_page():
-    return HTMLResponse(content=Path("templates/billing.html").read_text())
+    return HTMLResponse(content=load_page("billing.html"))
 
 
 @router.get("/billing/success", response_class=HTMLResponse)
 async def billing_success():
-    return HTMLResponse(content=Path("templates/billing_success.html").read_text())
+    return HTMLResponse(content=load_page("billing_success.html"))
 
 
 @router.post("/api/billing/checkout")
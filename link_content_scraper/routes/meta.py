@@ -1,18 +1,17 @@
 # ABOUTME: Site-level routes — the web UI entry point and the health check.
 # ABOUTME: No domain logic; just serves the index page and reports config status.
-from pathlib import Path
-
 from fastapi import APIRouter
 from fastapi.responses import HTMLResponse, JSONResponse
 
 from .. import config as _config
+from .pages import load_page
 
 router = APIRouter()
 
 
 @router.get("/", response_class=HTMLResponse)
 async def index():
-    return HTMLResponse(content=Path("templates/index.html").read_text())
+    return HTMLResponse(content=load_page("index.html"))
 
 
 @router.get("/health")
@@ -0,0 +1,15 @@
+# ABOUTME: Loads the static HTML pages served by the site and billing routes.
+# ABOUTME: Each file is read once per process and kept as encoded bytes.
+import functools
+from pathlib import Path
+
+TEMPLATES_DIR = Path("templates")
+
+
+@functools.cache
+def load_page(name: str) -> bytes:
+    """Return the raw bytes of ``templates/<name>``, read on first use only.
+
+    The pages are static, so edits take effect after a restart.
+    """
+    return (TEMPLATES_DIR / name).read_bytes()
@@ -38,11 +38,8 @@ async def start_scraping(
     try:
         all_urls, zip_path = await scrape_site(url, tracker_id, job_id, usage)
         await job_store.store_result(job_id, zip_path, customer.stripe_customer_id)
-        await job_store.release_tracker(tracker_id)
 
         state = await progress_tracker.get(tracker_id)
-        await progress_tracker.remove(tracker_id)
-
         if state is None:
             logger.error("Progress tracker missing for %s before results could be read", tracker_id)
             state = {"successful": 0, "skipped": 0, "failed": 0}
@@ -56,8 +53,6 @@ async def start_scraping(
             failed=state["failed"],
         )
     except httpx.HTTPStatusError as e:
-        await progress_tracker.remove(tracker_id)
-        await job_store.release_tracker(tracker_id)
         code = e.response.status_code
         if code == 403:
             detail = "The target site returned 403 Forbidden — it may be blocking automated access."
@@ -68,10 +63,13 @@ async def start_scraping(
         logger.warning("Upstream HTTP %d for %s", code, url)
         raise HTTPException(status_code=502, detail=detail)
     except (httpx.HTTPError, ValueError, OSError) as e:
-        await progress_tracker.remove(tracker_id)
-        await job_store.release_tracker(tracker_id)
         logger.exception("Scrape failed for %s", url)
         raise HTTPException(status_code=500, detail=f"Error scraping URL: {e}")
+    finally:
+        # Whatever happened — including unexpected errors and client
+        # disconnects — the job's tracker state must not outlive it.
+        await progress_tracker.remove(tracker_id)
+        await job_store.release_tracker(tracker_id)
 
 
 @router.get("/api/scrape/progress")
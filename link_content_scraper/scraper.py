@@ -1,23 +1,30 @@
 # ABOUTME: Core scraping logic — fetches URLs via Jina Reader API with retries.
-# ABOUTME: Handles batched processing, cancellation, and ZIP file creation.
+# ABOUTME: Handles concurrent fetching, cancellation, and ZIP file creation.
 import asyncio
+import http.cookiejar
 import logging
-import shutil
 import tempfile
 import time
 import zipfile
 from pathlib import Path
+from urllib.parse import urldefrag
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from .config import (
-    BATCH_SIZE,
     DEFAULT_TIMEOUT,
+    KEEPALIVE_EXPIRY,
+    MAX_CONNECTIONS,
+    MAX_CONCURRENCY,
+    MAX_CONTENT_BYTES,
+    MAX_KEEPALIVE_CONNECTIONS,
     MAX_RETRIES,
+    MAX_RETRY_DELAY,
     PDF_TIMEOUT,
-    RATE_PERIOD,
     RETRY_DELAY,
+    ZIP_COMPRESSION,
+    ZIP_COMPRESSLEVEL,
 )
 from .content import create_safe_filename, extract_title_from_content, is_content_valid
 from .filters import is_pdf_url, should_skip_url, transform_arxiv_url
@@ -31,26 +38,143 @@ rate_limiter = RateLimiter()
 
 _BOILERPLATE_TAGS = frozenset({'header', 'footer', 'nav', 'aside'})
 
+# Characters encoded per write when streaming a document into the ZIP
+_ZIP_CHUNK_CHARS = 64 * 1024
 
-def extract_content_links(soup: BeautifulSoup) -> list[str]:
+
+def _zip_method(name: str) -> int:
+    """Map a SCRAPER_ZIP_COMPRESSION value to a zipfile compression constant."""
+    if name == "zstd":
+        zstd = getattr(zipfile, "ZIP_ZSTANDARD", None)  # Python 3.14+
+        if zstd is not None:
+            return zstd
+        logger.warning("Zstandard ZIP compression needs Python 3.14+; using deflate")
+    elif name != "deflate":
+        logger.warning("Unknown SCRAPER_ZIP_COMPRESSION %r; using deflate", name)
+    return zipfile.ZIP_DEFLATED
+
+
+_ZIP_METHOD = _zip_method(ZIP_COMPRESSION)
+
+# Process-wide HTTP client, shared by every scrape job so connections (and
+# their TLS sessions) to r.jina.ai are pooled instead of re-established per job.
+# HTTP/2 lets concurrent fetches multiplex over those pooled connections.
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _no_cookies() -> http.cookiejar.CookieJar:
+    """A cookie jar that refuses to store any cookie.
+
+    The shared client serves every customer's jobs, so a Set-Cookie from one
+    job's site (or from Jina) must never be replayed on another job's requests.
+    Passed to httpx as a bare CookieJar: wrapping it in httpx.Cookies would be
+    copied into a default jar, losing the policy.
+    """
+    policy = http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    return http.cookiejar.CookieJar(policy=policy)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use.
+
+    A client's pooled connections belong to the event loop that opened them,
+    so a fresh client is created if the running loop has changed.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            cookies=_no_cookies(),
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient, if one was created (idempotent).
+
+    A client opened on a different (possibly already closed) loop can't be
+    closed from here, so it is simply dropped.
+    """
+    global _http_client, _http_client_loop
+    client, loop = _http_client, _http_client_loop
+    _http_client = _http_client_loop = None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+def _in_boilerplate(node: LexborNode) -> bool:
+    """Return True if any ancestor of ``node`` is a page-chrome element."""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in _BOILERPLATE_TAGS:
+            return True
+        parent = parent.parent
+    return False
+
+
+def extract_content_links(tree: LexborHTMLParser) -> list[str]:
     """Extract links from the main content area, ignoring navigation chrome.
 
     Prefers <main>, <article>, or role="main". Falls back to full document
     minus <header>, <footer>, <nav>, <aside>. Deduplicates preserving order.
     """
     content = (
-        soup.find('main')
-        or soup.find('article')
-        or soup.find(attrs={'role': 'main'})
+        tree.css_first('main')
+        or tree.css_first('article')
+        or tree.css_first('[role="main"]')
     )
     if content is not None:
-        anchors = content.find_all('a', href=True)
+        anchors = content.css('a[href]')
     else:
-        anchors = [
-            a for a in soup.find_all('a', href=True)
-            if not any(a.find_parent(tag) for tag in _BOILERPLATE_TAGS)
-        ]
-    return list(dict.fromkeys(a['href'] for a in anchors))
+        anchors = [a for a in tree.css('a[href]') if not _in_boilerplate(a)]
+    return list(dict.fromkeys(a.attributes.get('href') or '' for a in anchors))
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """Seconds to wait before retry number ``attempt`` (1-based).
+
+    Honors a numeric Retry-After header from the upstream when present;
+    otherwise backs off exponentially from RETRY_DELAY. Either way the wait
+    is capped at MAX_RETRY_DELAY, since a sleeping fetch holds one of the
+    job's concurrency slots and keeps the scrape request open.
+    """
+    delay = RETRY_DELAY * 2 ** (attempt - 1)
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = max(0.0, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form — fall back to our own backoff
+    return min(delay, MAX_RETRY_DELAY)
+
+
+async def _read_body(response: httpx.Response) -> str:
+    """Read a streamed response body as text, stopping at MAX_CONTENT_BYTES.
+
+    Oversized documents are truncated instead of being buffered whole.
+    """
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= MAX_CONTENT_BYTES:
+            logger.warning("Truncating %s at %d bytes", response.url, MAX_CONTENT_BYTES)
+            break
+    body = b"".join(chunks)
+    if size > MAX_CONTENT_BYTES:
+        body = body[:MAX_CONTENT_BYTES]
+    return body.decode(response.encoding or "utf-8", errors="replace")
 
 
 async def get_markdown_content(
@@ -75,7 +199,7 @@ async def get_markdown_content(
 
     transformed_url = transform_arxiv_url(url)
     if transformed_url != url:
-        logger.info("URL transformation: %s -> %s", url, transformed_url)
+        logger.debug("URL transformation: %s -> %s", url, transformed_url)
 
     is_pdf = is_pdf_url(transformed_url)
     timeout = PDF_TIMEOUT if is_pdf else DEFAULT_TIMEOUT
@@ -90,18 +214,19 @@ async def get_markdown_content(
             await rate_limiter.acquire()
 
             jina_url = f"https://r.jina.ai/{transformed_url}"
-            logger.info("Fetching: %s", jina_url)
+            logger.debug("Fetching: %s", jina_url)
 
-            response = await client.get(jina_url, timeout=timeout)
+            async with client.stream("GET", jina_url, timeout=timeout) as response:
+                body = await _read_body(response) if response.status_code == 200 else ""
 
             if response.status_code == 200:
-                content = response.text.strip()
+                content = body.strip()
 
                 if not is_content_valid(content):
                     raise ValueError("Retrieved content too short or metadata-only")
 
                 elapsed = time.time() - start_time
-                logger.info("Fetched %s in %.2fs (%d chars)", url, elapsed, len(content))
+                logger.debug("Fetched %s in %.2fs (%d chars)", url, elapsed, len(content))
                 await progress_tracker.increment(tracker_id, processed=1, potential_successful=1)
                 if usage is not None:
                     # Metering is best-effort: a recording failure must never
@@ -115,8 +240,8 @@ async def get_markdown_content(
             if response.status_code == 429:
                 retries += 1
                 if retries <= MAX_RETRIES:
-                    wait_time = RETRY_DELAY * retries
-                    logger.warning("Rate-limited on %s, waiting %ds", url, wait_time)
+                    wait_time = _retry_delay(retries, response)
+                    logger.warning("Rate-limited on %s, waiting %.1fs", url, wait_time)
                     await asyncio.sleep(wait_time)
                     continue
 
@@ -130,7 +255,7 @@ async def get_markdown_content(
             # Retry network errors and content validation failures only
             retries += 1
             if retries <= MAX_RETRIES:
-                wait_time = RETRY_DELAY * retries
+                wait_time = _retry_delay(retries)
                 logger.warning("Error on %s (attempt %d/%d): %s", url, retries, MAX_RETRIES, e)
                 await asyncio.sleep(wait_time)
                 continue
@@ -141,49 +266,69 @@ async def get_markdown_content(
     return url, ""
 
 
+def _write_zip_entry(zipf: zipfile.ZipFile, name: str, url: str, content: str) -> None:
+    """Compress one markdown document into the archive, a chunk at a time.
+
+    Encoding in ZIP_CHUNK_CHARS slices avoids holding a second, encoded copy
+    of the whole document in memory alongside the original string.
+    """
+    info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    info.compress_type = zipf.compression
+    info.external_attr = 0o644 << 16  # -rw-r--r--
+    try:
+        info.compress_level = zipf.compresslevel  # Python 3.13+
+    except AttributeError:
+        info._compresslevel = zipf.compresslevel  # 3.12 only has the private slot
+    with zipf.open(info, 'w') as dest:
+        dest.write(f"# Original URL: {url}\n\n".encode("utf-8"))
+        for start in range(0, len(content), _ZIP_CHUNK_CHARS):
+            dest.write(content[start:start + _ZIP_CHUNK_CHARS].encode("utf-8"))
+
+
 def create_zip_file(
     contents: list[tuple[str, str]],
     job_id: str,
 ) -> tuple[str, int]:
     """Write valid scraped content into a ZIP of markdown files.
 
-    Returns (zip_path, confirmed_success_count).
+    Each document is compressed straight into the archive; nothing is staged
+    on disk first. Returns (zip_path, confirmed_success_count).
     Raises if no valid content exists.
     """
-    temp_dir = Path(tempfile.gettempdir()) / job_id
-    temp_dir.mkdir(parents=True, exist_ok=True)
-
-    file_count = 0
+    files: dict[str, tuple[str, str]] = {}
     for url, content in contents:
         if not content or not is_content_valid(content):
             continue
 
         title = extract_title_from_content(content)
         safe_filename = create_safe_filename(title, url)
-        logger.info("Writing %s for %s", safe_filename, url)
-
-        file_path = temp_dir / safe_filename
-        file_path.write_text(f"# Original URL: {url}\n\n{content}", encoding="utf-8")
-        file_count += 1
+        if safe_filename in files:
+            continue  # Same URL scraped twice — keep a single copy
+        logger.debug("Writing %s for %s", safe_filename, url)
+        files[safe_filename] = (url, content)
 
-    if file_count == 0:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    if not files:
         raise ValueError("No valid content to download")
 
-    zip_path = temp_dir.parent / f"{job_id}.zip"
+    zip_path = Path(tempfile.gettempdir()) / f"{job_id}.zip"
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for md_file in temp_dir.glob('*.md'):
-                zipf.write(md_file, md_file.name)
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-    return str(zip_path), file_count
+        with zipfile.ZipFile(
+            zip_path, 'w', _ZIP_METHOD, compresslevel=ZIP_COMPRESSLEVEL
+        ) as zipf:
+            for name, (url, content) in files.items():
+                _write_zip_entry(zipf, name, url, content)
+    except BaseException:
+        zip_path.unlink(missing_ok=True)
+        raise
+    return str(zip_path), len(files)
 
 
 async def _discover_links(client: httpx.AsyncClient, url: str) -> list[str]:
     """Fetch the page's HTML and return its content links worth scraping.
 
-    Keeps only absolute http(s) links that aren't on the skip-list.
+    Keeps only absolute http(s) links that aren't on the skip-list. Links
+    are deduplicated by what Jina would actually fetch: fragments are
+    dropped, and links back to the page itself are ignored.
 
     Note: this fetches the raw HTML directly, separate from the Jina markdown
     fetch in get_markdown_content — the two retrieve different representations
@@ -192,11 +337,18 @@ async def _discover_links(client: httpx.AsyncClient, url: str) -> list[str]:
     """
     response = await client.get(url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, 'html.parser')
-    return [
-        href for href in extract_content_links(soup)
-        if href.startswith('http') and not should_skip_url(href)
-    ]
+    tree = LexborHTMLParser(response.text)
+
+    seen = {urldefrag(url).url}
+    links: list[str] = []
+    for href in extract_content_links(tree):
+        if not href.startswith('http') or should_skip_url(href):
+            continue
+        target = urldefrag(href).url
+        if target not in seen:
+            seen.add(target)
+            links.append(target)
+    return links
 
 
 async def _fetch_all(
@@ -205,33 +357,36 @@ async def _fetch_all(
     tracker_id: str,
     usage: UsageRecorder | None,
 ) -> list[tuple[str, str]]:
-    """Fetch markdown for every link in rate-limited batches.
+    """Fetch markdown for every link concurrently.
 
-    Honors cancellation between batches and tolerates per-task failures.
+    At most MAX_CONCURRENCY fetches are in flight at once; the shared rate
+    limiter does the actual request pacing. Honors cancellation (each fetch
+    checks it, and cancel() aborts registered tasks; those links count as
+    skipped) and tolerates per-task failures.
     """
-    results: list[tuple[str, str]] = []
-    for i in range(0, len(links), BATCH_SIZE):
-        if await progress_tracker.is_cancelled(tracker_id):
-            break
+    slots = asyncio.Semaphore(MAX_CONCURRENCY)
 
-        batch = links[i:i + BATCH_SIZE]
-        tasks = [
-            asyncio.create_task(get_markdown_content(link, client, tracker_id, usage))
-            for link in batch
-        ]
-        await progress_tracker.register_tasks(tracker_id, tasks)
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def fetch(link: str) -> tuple[str, str]:
+        async with slots:
+            return await get_markdown_content(link, client, tracker_id, usage)
 
-        for result in batch_results:
-            if isinstance(result, tuple):
-                results.append(result)
-            elif isinstance(result, BaseException):
-                logger.error("Unhandled task exception: %s", result)
-                await progress_tracker.increment(tracker_id, processed=1, failed=1)
-
-        if i + BATCH_SIZE < len(links):
-            await asyncio.sleep(RATE_PERIOD / 2)  # Wait 30 seconds between batches
+    tasks = [asyncio.create_task(fetch(link)) for link in links]
+    await progress_tracker.register_tasks(tracker_id, tasks)
+    task_results = await asyncio.gather(*tasks, return_exceptions=True)
 
+    results: list[tuple[str, str]] = []
+    cancelled = 0
+    for result in task_results:
+        if isinstance(result, tuple):
+            results.append(result)
+        elif isinstance(result, asyncio.CancelledError):
+            # The user cancelled the job; these links weren't failures
+            cancelled += 1
+        elif isinstance(result, BaseException):
+            logger.error("Unhandled task exception: %s", result)
+            await progress_tracker.increment(tracker_id, processed=1, failed=1)
+    if cancelled:
+        await progress_tracker.increment(tracker_id, processed=cancelled, skipped=cancelled)
     return results
 
 
@@ -245,18 +400,30 @@ async def scrape_site(
 
     Returns (list_of_all_urls, zip_path).
     """
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-        # 1. Fetch the original URL's content.
-        original_result = await get_markdown_content(url, client, tracker_id, usage)
+    client = get_http_client()
 
-        # 2. Discover the links worth following from its main content area.
+    # 1. Fetch the original URL's content and, concurrently, discover the
+    #    links worth following from its main content area. The two requests
+    #    go to different hosts (Jina vs. the site itself), so they overlap.
+    seed = asyncio.create_task(get_markdown_content(url, client, tracker_id, usage))
+    try:
         links = await _discover_links(client, url)
-        await progress_tracker.init(tracker_id, total=len(links) + 1, processed=1)
-
-        # 3. Fetch every linked page in rate-limited batches.
-        results = [original_result]
-        results.extend(await _fetch_all(client, links, tracker_id, usage))
-
-        zip_path, confirmed = create_zip_file(results, job_id)
-        await progress_tracker.update(tracker_id, successful=confirmed)
-        return [url] + links, zip_path
+    except BaseException:
+        # Wait for the seed to actually stop, so it can't touch the tracker
+        # after we return and any error it hit is retrieved, not left unlogged
+        seed.cancel()
+        await asyncio.gather(seed, return_exceptions=True)
+        raise
+    original_result = await seed
+    await progress_tracker.init(tracker_id, total=len(links) + 1, processed=1)
+
+    # 3. Fetch every linked page, rate-limited and with bounded concurrency.
+    results = [original_result]
+    results.extend(await _fetch_all(client, links, tracker_id, usage))
+
+    # Compression is CPU-bound; keep it off the event loop so other jobs'
+    # progress streams and cancel requests stay responsive meanwhile.
+    zip_path, confirmed = await asyncio.to_thread(create_zip_file, results, job_id)
+    await progress_tracker.update(tracker_id, successful=confirmed)
+    logger.info("Scraped %s: %d of %d pages saved", url, confirmed, len(links) + 1)
+    return [url] + links, zip_path
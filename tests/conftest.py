@@ -10,6 +10,16 @@ from fastapi.testclient import TestClient
 import pytest
 
 from link_content_scraper.app import create_app
+from link_content_scraper.scraper import close_http_client
+
+
+# -- Shared scraper HTTP client ------------------------------------------------
+
+@pytest.fixture(autouse=True)
+async def _close_shared_http_client():
+    """Close the scraper's shared HTTP client on the loop that opened it."""
+    yield
+    await close_http_client()
 
 
 # -- Local test HTTP server ----------------------------------------------------
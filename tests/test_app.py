@@ -103,3 +103,38 @@ class TestSentryInit:
             app = create_app()  # must not raise
         assert app is not None
         assert any("Sentry initialization failed" in m for m in caplog.messages)
+
+
+class TestConfigureLogging:
+    def test_installs_queue_handler_on_bare_root_logger(self, monkeypatch):
+        import atexit
+        import logging
+        import logging.handlers
+
+        from link_content_scraper.app import _configure_logging
+
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        stops = []
+        monkeypatch.setattr(atexit, "register", stops.append)
+
+        _configure_logging()
+        try:
+            assert len(root.handlers) == 1
+            assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+        finally:
+            for stop in stops:
+                stop()
+
+    def test_leaves_existing_handlers_alone(self, monkeypatch):
+        import logging
+
+        from link_content_scraper.app import _configure_logging
+
+        root = logging.getLogger()
+        existing = logging.NullHandler()
+        monkeypatch.setattr(root, "handlers", [existing])
+
+        _configure_logging()
+        assert root.handlers == [existing]
@@ -35,6 +35,18 @@ class TestExtractTitle:
         content = "# [Getting Started with **Python**](https://python.org)\n\nBody."
         assert extract_title_from_content(content) == "Getting Started with Python"
 
+    def test_h1_preferred_over_earlier_h2(self):
+        content = "## Table of Contents\n\n# The Real Title\n\nBody."
+        assert extract_title_from_content(content) == "The Real Title"
+
+    def test_header_beyond_search_window_ignored(self):
+        content = "filler line\n" * 40 + "# Too Late To Count\n\nBody."
+        assert extract_title_from_content(content) is None
+
+    def test_header_beyond_char_cap_ignored(self):
+        content = "x" * 5000 + "\n# Past The Cap\n\nBody."
+        assert extract_title_from_content(content) is None
+
     def test_no_title(self):
         content = "URL Source: https://example.com\n\nJust some text."
         assert extract_title_from_content(content) is None
@@ -76,6 +88,10 @@ class TestCreateSafeFilename:
         fn = create_safe_filename("Cafe: A Guide to Emigre Literature", "https://example.com")
         assert fn.endswith(".md")
 
+    def test_accented_title_folded_to_ascii(self):
+        fn = create_safe_filename("Café: A Guide to Émigré Literature", "https://example.com")
+        assert fn.startswith("Cafe-A-Guide-to-Emigre-Literature_")
+
     def test_only_special_chars(self):
         fn = create_safe_filename("!!!???###", "https://example.com/special")
         assert fn.startswith("untitled_")
@@ -103,3 +119,10 @@ class TestIsContentValid:
     def test_metadata_only(self):
         content = "# Original URL: https://x.com\nTitle: X\nURL Source: https://x.com\n"
         assert is_content_valid(content) is False
+
+    def test_metadata_then_body_is_valid(self):
+        content = (
+            "Title: X\nURL Source: https://x.com\nMarkdown Content:\n\n"
+            "An actual paragraph of article text follows the metadata."
+        )
+        assert is_content_valid(content) is True
@@ -19,6 +19,7 @@ class TestShouldSkipUrl:
         "https://example.com/photo.PNG",
         "https://example.com/image.gif",
         "https://example.com/image.webp",
+        "https://WWW.YouTube.com/watch?v=abc",
     ])
     def test_skip(self, url):
         assert should_skip_url(url) is True
@@ -50,6 +51,10 @@ class TestTransformArxivUrl:
         url = "https://arxiv.org/pdf/2301.00001.pdf"
         assert transform_arxiv_url(url) == url
 
+    def test_pdf_path_without_suffix_unchanged(self):
+        url = "https://arxiv.org/pdf/2301.00001"
+        assert transform_arxiv_url(url) == url
+
     def test_non_arxiv(self):
         url = "https://example.com/paper"
         assert transform_arxiv_url(url) == url
@@ -63,3 +63,24 @@ async def test_schedule_cleanup_tolerates_missing_file(tmp_path):
     # Give the (already-awaited) task a tick to settle and confirm cleanup ran.
     await asyncio.sleep(0)
     assert await store.get_result("job1", "cus_a") is None
+
+
+async def test_expired_result_is_hidden():
+    store = JobStore(result_ttl=0)
+    await store.store_result("job1", "/tmp/job1.zip", "cus_a")
+
+    assert await store.get_result("job1", "cus_a") is None
+
+
+async def test_undownloaded_result_expires_on_its_own(tmp_path):
+    store = JobStore(result_ttl=0)
+    stale = tmp_path / "stale.zip"
+    stale.write_bytes(b"PK\x03\x04")
+    await store.store_result("old", str(stale), "cus_a")
+
+    # No further activity on the store: the expiry scheduled at store time
+    # still removes the entry and its ZIP.
+    await asyncio.gather(*store._background_tasks)
+
+    assert not stale.exists()
+    assert "old" not in store._results
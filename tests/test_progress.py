@@ -150,7 +150,7 @@ class TestGenerateEvents:
 
         assert len(events) >= 1
         # Parse the SSE data line
-        data_str = events[0].replace("data: ", "").strip()
+        data_str = events[0].removeprefix(b"data: ").strip()
         data = json.loads(data_str)
         assert "total" in data
         assert "processed" in data
@@ -166,7 +166,7 @@ class TestGenerateEvents:
 
         # Should get exactly one final event
         assert len(events) == 1
-        data = json.loads(events[0].replace("data: ", "").strip())
+        data = json.loads(events[0].removeprefix(b"data: ").strip())
         assert data["processed"] >= data["total"]
 
     async def test_terminates_on_cancel(self, tracker):
@@ -177,9 +177,81 @@ class TestGenerateEvents:
             events.append(event)
             await tracker.cancel("job1")
 
-        last_data = json.loads(events[-1].replace("data: ", "").strip())
+        last_data = json.loads(events[-1].removeprefix(b"data: ").strip())
         assert last_data["cancelled"] is True
 
+    async def test_stops_when_tracker_removed_mid_stream(self, tracker):
+        await tracker.init("job1", total=10, processed=0)
+
+        events = []
+        async for event in tracker.generate_events("job1"):
+            events.append(event)
+            await tracker.remove("job1")
+
+        # One progress frame, then a clean stop without waiting out the timeout
+        assert len(events) == 1
+
+    async def test_pushes_event_as_soon_as_state_changes(self, tracker, monkeypatch):
+        import link_content_scraper.progress as progress_mod
+        monkeypatch.setattr(progress_mod, "_HEARTBEAT_SECONDS", 60)
+        await tracker.init("job1", total=2, processed=0)
+
+        events = []
+        stream = tracker.generate_events("job1")
+        events.append(await anext(stream))
+        asyncio.get_running_loop().call_later(
+            0.01, asyncio.ensure_future, tracker.increment("job1", processed=1)
+        )
+        events.append(await asyncio.wait_for(anext(stream), timeout=1))
+        await stream.aclose()
+
+        assert json.loads(events[1].removeprefix(b"data: ").strip())["processed"] == 1
+
+    async def test_every_stream_on_a_tracker_sees_each_change(self, tracker, monkeypatch):
+        import link_content_scraper.progress as progress_mod
+        monkeypatch.setattr(progress_mod, "_HEARTBEAT_SECONDS", 60)
+        await tracker.init("job1", total=3, processed=0)
+
+        first, second = tracker.generate_events("job1"), tracker.generate_events("job1")
+        await anext(first)
+        await anext(second)
+        # One change, picked up by the first stream before the second resumes:
+        # the second must still see it rather than wait for the heartbeat
+        await tracker.increment("job1", processed=1)
+        frame_a = await asyncio.wait_for(anext(first), timeout=1)
+        frame_b = await asyncio.wait_for(anext(second), timeout=1)
+        await first.aclose()
+        await second.aclose()
+
+        for frame in (frame_a, frame_b):
+            assert json.loads(frame.removeprefix(b"data: ").strip())["processed"] == 1
+
+    async def test_stream_reports_last_change_before_removal(self, tracker, monkeypatch):
+        import link_content_scraper.progress as progress_mod
+        monkeypatch.setattr(progress_mod, "_HEARTBEAT_SECONDS", 60)
+        await tracker.init("job1", total=3, processed=0)
+
+        stream = tracker.generate_events("job1")
+        await anext(stream)
+        await tracker.increment("job1", processed=1, failed=1)
+        await tracker.remove("job1")
+
+        events = [event async for event in stream]
+        assert len(events) == 1
+        assert json.loads(events[0].removeprefix(b"data: ").strip())["failed"] == 1
+
+    async def test_heartbeat_resends_unchanged_state(self, tracker, monkeypatch):
+        import link_content_scraper.progress as progress_mod
+        monkeypatch.setattr(progress_mod, "_HEARTBEAT_SECONDS", 0.01)
+        await tracker.init("job1", total=2, processed=0)
+
+        stream = tracker.generate_events("job1")
+        first = await anext(stream)
+        second = await asyncio.wait_for(anext(stream), timeout=1)
+        await stream.aclose()
+
+        assert first == second
+
     async def test_timeout_on_missing_tracker(self, tracker, monkeypatch):
         # Reduce max wait iterations so test doesn't take 30 seconds
         import link_content_scraper.progress as progress_mod
@@ -190,6 +262,6 @@ class TestGenerateEvents:
             events.append(event)
 
         assert len(events) == 1
-        data = json.loads(events[0].replace("data: ", "").strip())
+        data = json.loads(events[0].removeprefix(b"data: ").strip())
         assert "error" in data
         assert "not found" in data["error"].lower()
@@ -65,6 +65,23 @@ class TestIndexEndpoint:
         assert "text/html" in resp.headers["content-type"]
         assert "Link Scraper" in resp.text
 
+    def test_index_page_read_from_disk_once(self, client, monkeypatch):
+        from link_content_scraper.routes import pages
+
+        pages.load_page.cache_clear()
+        reads = []
+        original = pages.Path.read_bytes
+
+        def _counting_read(self):
+            reads.append(self.name)
+            return original(self)
+
+        monkeypatch.setattr(pages.Path, "read_bytes", _counting_read)
+        first = client.get("/")
+        second = client.get("/")
+        assert first.content == second.content
+        assert reads == ["index.html"]
+
 
 class TestCancelEndpoint:
     def test_cancel_requires_auth(self, client):
@@ -562,6 +579,29 @@ class TestScrapeErrorHandling:
         assert resp.status_code == 500
         assert "bad data" in resp.json()["detail"]
 
+    def test_unexpected_error_still_clears_tracker_state(self, client, monkeypatch):
+        import asyncio
+
+        import link_content_scraper.routes as routes_module
+        from link_content_scraper.jobs import job_store
+        from link_content_scraper.progress import progress_tracker
+
+        self._setup_auth_mock(monkeypatch)
+        url = "http://example.com/crash"
+        tracker_id = routes_module.scrape._tracker_id_for(url)
+
+        async def _raise(url, tracker_id, job_id, customer_id):
+            await progress_tracker.init(tracker_id, total=3)
+            raise RuntimeError("unexpected")
+
+        monkeypatch.setattr(routes_module.scrape, "scrape_site", _raise)
+
+        with pytest.raises(RuntimeError):
+            client.post("/api/scrape", json={"url": url}, headers={"x-api-key": "test-key"})
+
+        assert asyncio.run(progress_tracker.exists(tracker_id)) is False
+        assert asyncio.run(job_store.tracker_owner(tracker_id)) is None
+
     def test_progress_tracker_missing_uses_zero_counts(self, client, monkeypatch, tmp_path):
         """If the progress tracker is missing after a successful scrape, response uses zeros."""
         import link_content_scraper.routes as routes_module
@@ -1,18 +1,24 @@
 # ABOUTME: Unit tests for scraper module functions (create_zip_file, get_markdown_content).
 # ABOUTME: Uses httpx MockTransport for HTTP control and monkeypatched singletons.
 
+import asyncio
+import time
 import zipfile
 from pathlib import Path
 
 import httpx
 import pytest
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from link_content_scraper.progress import ProgressTracker
 from link_content_scraper.rate_limit import RateLimiter
 from link_content_scraper.scraper import (
+    _write_zip_entry,
+    _zip_method,
+    close_http_client,
     create_zip_file,
     extract_content_links,
+    get_http_client,
     get_markdown_content,
     scrape_site,
 )
@@ -20,8 +26,8 @@ from link_content_scraper.scraper import (
 
 # -- extract_content_links -----------------------------------------------------
 
-def _soup(html: str) -> BeautifulSoup:
-    return BeautifulSoup(html, 'html.parser')
+def _tree(html: str) -> LexborHTMLParser:
+    return LexborHTMLParser(html)
 
 
 class TestExtractContentLinks:
@@ -33,7 +39,7 @@ class TestExtractContentLinks:
           <footer><a href="https://example.com/footer">Footer</a></footer>
         </body></html>
         """
-        assert extract_content_links(_soup(html)) == ["https://example.com/article"]
+        assert extract_content_links(_tree(html)) == ["https://example.com/article"]
 
     def test_article_tag_used_when_no_main(self):
         html = """
@@ -42,7 +48,7 @@ class TestExtractContentLinks:
           <article><a href="https://example.com/content">Content</a></article>
         </body></html>
         """
-        assert extract_content_links(_soup(html)) == ["https://example.com/content"]
+        assert extract_content_links(_tree(html)) == ["https://example.com/content"]
 
     def test_role_main_used_when_no_main_or_article(self):
         html = """
@@ -51,7 +57,7 @@ class TestExtractContentLinks:
           <div role="main"><a href="https://example.com/content">Content</a></div>
         </body></html>
         """
-        assert extract_content_links(_soup(html)) == ["https://example.com/content"]
+        assert extract_content_links(_tree(html)) == ["https://example.com/content"]
 
     def test_fallback_strips_boilerplate_tags(self):
         html = """
@@ -62,7 +68,7 @@ class TestExtractContentLinks:
           <aside><a href="https://example.com/sidebar">Sidebar</a></aside>
         </body></html>
         """
-        links = extract_content_links(_soup(html))
+        links = extract_content_links(_tree(html))
         assert "https://example.com/body" in links
         assert "https://example.com/nav" not in links
         assert "https://example.com/footer" not in links
@@ -78,10 +84,43 @@ class TestExtractContentLinks:
           </main>
         </body></html>
         """
-        assert extract_content_links(_soup(html)) == ["https://a.com/1", "https://a.com/2"]
+        assert extract_content_links(_tree(html)) == ["https://a.com/1", "https://a.com/2"]
 
     def test_empty_page_returns_empty_list(self):
-        assert extract_content_links(_soup("<html><body></body></html>")) == []
+        assert extract_content_links(_tree("<html><body></body></html>")) == []
+
+
+# -- shared HTTP client --------------------------------------------------------
+
+class TestHttpClient:
+    async def test_client_is_reused_across_calls(self):
+        try:
+            assert get_http_client() is get_http_client()
+        finally:
+            await close_http_client()
+
+    async def test_close_releases_client_and_next_call_recreates(self):
+        first = get_http_client()
+        await close_http_client()
+        assert first.is_closed
+        second = get_http_client()
+        try:
+            assert second is not first
+        finally:
+            await close_http_client()
+
+    async def test_shared_client_never_stores_cookies(self):
+        client = get_http_client()
+        request = httpx.Request("GET", "https://example.com/")
+        response = httpx.Response(
+            200, headers={"Set-Cookie": "sess=customerA; Path=/"}, request=request
+        )
+        client.cookies.extract_cookies(response)
+        assert not client.cookies
+
+    async def test_close_without_client_is_noop(self):
+        await close_http_client()
+        await close_http_client()
 
 
 # -- create_zip_file edge cases ------------------------------------------------
@@ -111,6 +150,32 @@ class TestCreateZipFileEdges:
         finally:
             Path(zip_path).unlink(missing_ok=True)
 
+    def test_multi_chunk_unicode_content_round_trips(self):
+        body = "Ünïcödé text spanning many chunks. " * 5000  # > 64K chars
+        content = f"# Big Unicode Page\n\n{body}\n\nMore.\n\nEnd.\n"
+        zip_path, count = create_zip_file([("https://example.com/u", content)], "test-chunks")
+        try:
+            with zipfile.ZipFile(zip_path) as zf:
+                data = zf.read(zf.namelist()[0]).decode("utf-8")
+            assert data == f"# Original URL: https://example.com/u\n\n{content}"
+        finally:
+            Path(zip_path).unlink(missing_ok=True)
+
+    def test_same_url_twice_is_written_once(self):
+        content = f"# Repeated Page\n\n{VALID_BODY}"
+        contents = [
+            ("https://example.com/page", content),
+            ("https://example.com/page", content),
+        ]
+        zip_path, count = create_zip_file(contents, "test-repeat")
+        try:
+            assert count == 1
+            with zipfile.ZipFile(zip_path) as zf:
+                assert len(zf.namelist()) == 1
+            assert not (Path(zip_path).parent / "test-repeat").exists()
+        finally:
+            Path(zip_path).unlink(missing_ok=True)
+
     def test_content_with_no_extractable_title(self):
         content = f"Just some text without any headers at all.\n\n{VALID_BODY}"
         contents = [("https://example.com/no-title", content)]
@@ -138,6 +203,41 @@ class TestCreateZipFileEdges:
         finally:
             Path(zip_path).unlink(missing_ok=True)
 
+    def test_entry_uses_archive_compresslevel(self, tmp_path):
+        content = "compressible markdown line\n" * 2000
+        sizes = {}
+        for level in (0, 9):
+            path = tmp_path / f"level{level}.zip"
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+                _write_zip_entry(zf, "page.md", "https://example.com", content)
+            with zipfile.ZipFile(path) as zf:
+                sizes[level] = zf.getinfo("page.md").compress_size
+        # Level 0 stores the bytes uncompressed; level 9 must beat it by far
+        assert sizes[9] * 10 < sizes[0]
+
+    def test_entry_keeps_write_time_and_readable_mode(self, tmp_path, monkeypatch):
+        written_at = time.struct_time((2024, 5, 6, 7, 8, 10, 0, 127, -1))
+        monkeypatch.setattr(time, "localtime", lambda *args: written_at)
+        path = tmp_path / "entry.zip"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            _write_zip_entry(zf, "page.md", "https://example.com", "# Page\n")
+        with zipfile.ZipFile(path) as zf:
+            info = zf.getinfo("page.md")
+        assert info.date_time == (2024, 5, 6, 7, 8, 10)
+        assert info.external_attr >> 16 == 0o644
+
+
+class TestZipMethod:
+    def test_deflate_by_default(self):
+        assert _zip_method("deflate") == zipfile.ZIP_DEFLATED
+
+    def test_unknown_value_falls_back_to_deflate(self):
+        assert _zip_method("lzma-please") == zipfile.ZIP_DEFLATED
+
+    def test_zstd_used_when_available_else_deflate(self):
+        expected = getattr(zipfile, "ZIP_ZSTANDARD", zipfile.ZIP_DEFLATED)
+        assert _zip_method("zstd") == expected
+
 
 # -- get_markdown_content ------------------------------------------------------
 
@@ -179,6 +279,43 @@ def fast_limiter():
     return RateLimiter(limit=100, period=1)
 
 
+@pytest.fixture()
+def recorded_sleeps(monkeypatch):
+    """Make asyncio.sleep return at once, recording each requested delay."""
+    sleeps: list[float] = []
+
+    async def _spy_sleep(secs):
+        sleeps.append(secs)
+
+    monkeypatch.setattr(asyncio, "sleep", _spy_sleep)
+    return sleeps
+
+
+@pytest.fixture()
+async def mock_http(monkeypatch):
+    """Serve the scraper's shared HTTP client from a MockTransport.
+
+    Call it with a request handler (sync or async). The client gets the same
+    cookie jar as the real shared client.
+    """
+    from link_content_scraper import scraper as scraper_module
+
+    clients: list[httpx.AsyncClient] = []
+
+    def _install(handler) -> httpx.AsyncClient:
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            cookies=scraper_module._no_cookies(),
+        )
+        clients.append(client)
+        monkeypatch.setattr(scraper_module, "get_http_client", lambda: client)
+        return client
+
+    yield _install
+    for client in clients:
+        await client.aclose()
+
+
 class TestGetMarkdownContent:
     async def test_successful_fetch(self, monkeypatch, fresh_tracker, fast_limiter):
         monkeypatch.setattr("link_content_scraper.scraper.progress_tracker", fresh_tracker)
@@ -218,6 +355,79 @@ class TestGetMarkdownContent:
             url, content = await get_markdown_content("https://example.com/retry", client, "t1")
         assert "Test Article" in content
 
+    async def test_oversized_body_is_truncated(self, monkeypatch, fresh_tracker, fast_limiter):
+        from link_content_scraper import scraper as scraper_module
+
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
+        monkeypatch.setattr(scraper_module, "MAX_CONTENT_BYTES", 100)
+
+        await fresh_tracker.init("t1", total=1)
+        body = JINA_VALID_RESPONSE + "x" * 10_000
+        transport = _make_transport([(200, body)])
+        async with httpx.AsyncClient(transport=transport) as client:
+            url, content = await get_markdown_content("https://example.com/huge", client, "t1")
+        assert content == body[:100].strip()
+
+    async def test_429_honors_retry_after_header(
+        self, monkeypatch, fresh_tracker, fast_limiter, recorded_sleeps
+    ):
+        from link_content_scraper import scraper as scraper_module
+
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
+        monkeypatch.setattr(scraper_module, "RETRY_DELAY", 100)
+
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "2"}, text="slow down"),
+            httpx.Response(200, text=JINA_VALID_RESPONSE),
+        ])
+        transport = httpx.MockTransport(lambda request: next(responses))
+
+        await fresh_tracker.init("t1", total=1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            url, content = await get_markdown_content("https://example.com/retry-after", client, "t1")
+        assert content
+        assert recorded_sleeps == [2.0]
+
+    async def test_429_retry_after_is_capped(
+        self, monkeypatch, fresh_tracker, fast_limiter, recorded_sleeps
+    ):
+        from link_content_scraper import scraper as scraper_module
+
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
+        monkeypatch.setattr(scraper_module, "MAX_RETRY_DELAY", 30.0)
+
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "3600"}, text="slow down"),
+            httpx.Response(200, text=JINA_VALID_RESPONSE),
+        ])
+        transport = httpx.MockTransport(lambda request: next(responses))
+
+        await fresh_tracker.init("t1", total=1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            url, content = await get_markdown_content("https://example.com/retry-after", client, "t1")
+        assert content
+        assert recorded_sleeps == [30.0]
+
+    async def test_errors_back_off_exponentially(
+        self, monkeypatch, fresh_tracker, fast_limiter, recorded_sleeps
+    ):
+        from link_content_scraper import scraper as scraper_module
+
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
+        monkeypatch.setattr(scraper_module, "RETRY_DELAY", 1)
+        monkeypatch.setattr(scraper_module, "MAX_RETRIES", 3)
+
+        await fresh_tracker.init("t1", total=1)
+        transport = _make_transport([(500, "boom")] * 4)
+        async with httpx.AsyncClient(transport=transport) as client:
+            url, content = await get_markdown_content("https://example.com/backoff", client, "t1")
+        assert content == ""
+        assert recorded_sleeps == [1, 2, 4]
+
     async def test_content_validation_failure_retries_then_fails(self, monkeypatch, fresh_tracker, fast_limiter):
         monkeypatch.setattr("link_content_scraper.scraper.progress_tracker", fresh_tracker)
         monkeypatch.setattr("link_content_scraper.scraper.rate_limiter", fast_limiter)
@@ -281,7 +491,7 @@ class TestGetMarkdownContent:
 
         transport = httpx.MockTransport(handler)
         async with httpx.AsyncClient(transport=transport) as client:
-            with caplog.at_level(logging.INFO, logger="link_content_scraper.scraper"):
+            with caplog.at_level(logging.DEBUG, logger="link_content_scraper.scraper"):
                 url, content = await get_markdown_content(
                     "https://arxiv.org/abs/2401.12345", client, "t1"
                 )
@@ -414,7 +624,7 @@ def _index_page(link_urls: list[str]) -> str:
 
 class TestScrapeSite:
     async def test_basic_scrape_returns_urls_and_zip(
-        self, monkeypatch, fresh_tracker, fast_limiter, tmp_path
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http, tmp_path
     ):
         from link_content_scraper import scraper as scraper_module
 
@@ -430,25 +640,11 @@ class TestScrapeSite:
             # Otherwise, treat as Jina request
             return httpx.Response(200, text=JINA_VALID_RESPONSE)
 
-        transport = httpx.MockTransport(handler)
-
-        async def _runner():
-            # Patch httpx.AsyncClient inside scraper to use our transport
-            import httpx as httpx_mod
-            original = httpx_mod.AsyncClient
-
-            class _Patched(original):
-                def __init__(self, *args, **kwargs):
-                    kwargs["transport"] = transport
-                    super().__init__(*args, **kwargs)
+        mock_http(handler)
 
-            monkeypatch.setattr(scraper_module.httpx, "AsyncClient", _Patched)
-            urls, zip_path = await scrape_site(
-                "https://example.com/", "trk1", "job_basic", usage=None
-            )
-            return urls, zip_path
-
-        urls, zip_path = await _runner()
+        urls, zip_path = await scrape_site(
+            "https://example.com/", "trk1", "job_basic", usage=None
+        )
         try:
             assert urls[0] == "https://example.com/"
             assert sub in urls
@@ -456,125 +652,226 @@ class TestScrapeSite:
         finally:
             Path(zip_path).unlink(missing_ok=True)
 
-    async def test_scrape_site_runs_two_batches_with_sleep(
-        self, monkeypatch, fresh_tracker, fast_limiter, tmp_path
+    async def test_links_deduplicated_by_fetch_target(
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http
     ):
-        """With BATCH_SIZE=2 and 4 links, scrape_site must process two batches and sleep between them (line 236)."""
         from link_content_scraper import scraper as scraper_module
 
         monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
         monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
-        monkeypatch.setattr(scraper_module, "BATCH_SIZE", 2)
-        monkeypatch.setattr(scraper_module, "RATE_PERIOD", 0)  # so sleep is essentially instant
 
-        sleeps: list[float] = []
-        original_sleep = scraper_module.asyncio.sleep
+        page_links = [
+            "https://example.com/",  # the seed itself
+            "https://example.com/#top",  # the seed, via an in-page anchor
+            "https://example.com/sub1",
+            "https://example.com/sub1#section-2",
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == "https://example.com/":
+                return httpx.Response(200, text=_index_page(page_links))
+            return httpx.Response(200, text=JINA_VALID_RESPONSE)
+
+        mock_http(handler)
+
+        urls, zip_path = await scrape_site(
+            "https://example.com/", "trk_dedupe", "job_dedupe", usage=None
+        )
+        try:
+            assert urls == ["https://example.com/", "https://example.com/sub1"]
+        finally:
+            Path(zip_path).unlink(missing_ok=True)
 
-        async def _spy_sleep(secs):
-            sleeps.append(secs)
-            await original_sleep(0)
+    async def test_cookies_are_not_shared_between_jobs(
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http
+    ):
+        """A cookie set during one job must not be sent by the next job."""
+        from link_content_scraper import scraper as scraper_module
 
-        monkeypatch.setattr(scraper_module.asyncio, "sleep", _spy_sleep)
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
 
-        sub_urls = [f"https://example.com/sub{i}" for i in range(4)]
+        sent_cookies: list[str | None] = []
 
         def handler(request: httpx.Request) -> httpx.Response:
+            sent_cookies.append(request.headers.get("cookie"))
             if str(request.url) == "https://example.com/":
-                return httpx.Response(200, text=_index_page(sub_urls))
-            return httpx.Response(200, text=JINA_VALID_RESPONSE)
+                return httpx.Response(
+                    200,
+                    headers={"Set-Cookie": "sess=customerA; Path=/"},
+                    text=_index_page([]),
+                )
+            return httpx.Response(
+                200, headers={"Set-Cookie": "jina=1; Path=/"}, text=JINA_VALID_RESPONSE
+            )
 
-        transport = httpx.MockTransport(handler)
+        mock_http(handler)
 
-        import httpx as httpx_mod
-        original = httpx_mod.AsyncClient
+        for job in ("job_cookie_a", "job_cookie_b"):
+            _, zip_path = await scrape_site(
+                "https://example.com/", f"trk_{job}", job, usage=None
+            )
+            Path(zip_path).unlink(missing_ok=True)
 
-        class _Patched(original):
-            def __init__(self, *args, **kwargs):
-                kwargs["transport"] = transport
-                super().__init__(*args, **kwargs)
+        assert len(sent_cookies) == 4
+        assert sent_cookies == [None] * 4
 
-        monkeypatch.setattr(scraper_module.httpx, "AsyncClient", _Patched)
+    async def test_seed_fetch_overlaps_link_discovery(
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http
+    ):
+        from link_content_scraper import scraper as scraper_module
+
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
+
+        seed_in_flight = {"now": False, "overlapped": False}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if url == "https://r.jina.ai/https://example.com/":
+                seed_in_flight["now"] = True
+                await asyncio.sleep(0.05)
+                seed_in_flight["now"] = False
+                return httpx.Response(200, text=JINA_VALID_RESPONSE)
+            if url == "https://example.com/":
+                await asyncio.sleep(0.01)  # network latency
+                seed_in_flight["overlapped"] = seed_in_flight["now"]
+                return httpx.Response(200, text=_index_page([]))
+            return httpx.Response(200, text=JINA_VALID_RESPONSE)
+
+        mock_http(handler)
 
         urls, zip_path = await scrape_site(
-            "https://example.com/", "trk2", "job_batches", usage=None
+            "https://example.com/", "trk_overlap", "job_overlap", usage=None
         )
         try:
-            assert len(urls) == 5  # original + 4 sub
-            # Inter-batch sleep is RATE_PERIOD/2 = 0; verify it was called at least once
-            assert any(s == 0 for s in sleeps)
+            assert urls == ["https://example.com/"]
+            assert seed_in_flight["overlapped"] is True
         finally:
             Path(zip_path).unlink(missing_ok=True)
 
-    async def test_scrape_site_breaks_when_cancelled_between_batches(
-        self, monkeypatch, fresh_tracker, fast_limiter
+    async def test_failed_discovery_stops_seed_fetch_before_raising(
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http
     ):
-        """Cancellation between batches must short-circuit the for loop (line 218)."""
         from link_content_scraper import scraper as scraper_module
 
         monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
         monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
-        monkeypatch.setattr(scraper_module, "BATCH_SIZE", 1)
-        monkeypatch.setattr(scraper_module, "RATE_PERIOD", 0)
 
-        sub_urls = [f"https://example.com/sub{i}" for i in range(3)]
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == "https://example.com/":
+                return httpx.Response(403, text="Forbidden")
+            await asyncio.sleep(1)  # Seed fetch still in flight when discovery fails
+            return httpx.Response(200, text=JINA_VALID_RESPONSE)
 
-        def handler(request: httpx.Request) -> httpx.Response:
+        mock_http(handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await scrape_site("https://example.com/", "trk_nolinks", "job_nolinks", usage=None)
+
+        # The seed task has fully stopped by the time the error propagates
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert all(t.done() for t in pending)
+
+    async def test_scrape_site_bounds_concurrent_fetches(
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http
+    ):
+        """All links are fetched concurrently, but never more than MAX_CONCURRENCY at once."""
+        from link_content_scraper import scraper as scraper_module
+
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
+        monkeypatch.setattr(scraper_module, "MAX_CONCURRENCY", 2)
+
+        sub_urls = [f"https://example.com/sub{i}" for i in range(5)]
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
             if str(request.url) == "https://example.com/":
                 return httpx.Response(200, text=_index_page(sub_urls))
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
             return httpx.Response(200, text=JINA_VALID_RESPONSE)
 
-        transport = httpx.MockTransport(handler)
+        mock_http(handler)
 
-        import httpx as httpx_mod
-        original = httpx_mod.AsyncClient
+        urls, zip_path = await scrape_site(
+            "https://example.com/", "trk2", "job_concurrency", usage=None
+        )
+        try:
+            assert len(urls) == 6  # original + 5 sub
+            assert in_flight["peak"] == 2
+            state = await fresh_tracker.get("trk2")
+            assert state["processed"] == 6
+        finally:
+            Path(zip_path).unlink(missing_ok=True)
 
-        class _Patched(original):
-            def __init__(self, *args, **kwargs):
-                kwargs["transport"] = transport
-                super().__init__(*args, **kwargs)
+    async def test_scrape_site_stops_fetching_once_cancelled(
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http
+    ):
+        """Fetches still queued when the job is cancelled never reach Jina."""
+        from link_content_scraper import scraper as scraper_module
 
-        monkeypatch.setattr(scraper_module.httpx, "AsyncClient", _Patched)
+        monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
+        monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
+        monkeypatch.setattr(scraper_module, "MAX_CONCURRENCY", 1)
 
-        # Patch is_cancelled to return True on the second call to short-circuit batch loop
-        check_count = {"n": 0}
-        original_is_cancelled = fresh_tracker.is_cancelled
+        sub_urls = [f"https://example.com/sub{i}" for i in range(3)]
+        jina_requests: list[str] = []
+        sub0_in_flight = asyncio.Event()
 
-        async def _is_cancelled(tracker_id):
-            check_count["n"] += 1
-            # Allow initial fetches but cancel before all batches complete.
-            # The first batch processes one link (sub0), then the second batch's cancel-check trips.
-            if check_count["n"] > 4:
-                return True
-            return await original_is_cancelled(tracker_id)
+        async def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if url == "https://example.com/":
+                return httpx.Response(200, text=_index_page(sub_urls))
+            jina_requests.append(url)
+            if url.endswith("/sub0"):
+                sub0_in_flight.set()
+                await asyncio.sleep(1)  # Slow upstream; cancelled long before this ends
+            return httpx.Response(200, text=JINA_VALID_RESPONSE)
 
-        monkeypatch.setattr(fresh_tracker, "is_cancelled", _is_cancelled)
+        async def _cancel_when_sub0_in_flight():
+            # The user hits cancel while the first sub-page is being fetched
+            await sub0_in_flight.wait()
+            await fresh_tracker.cancel("trk_cancel")
 
-        # Pre-init tracker so create_zip_file step has at least one valid result
+        mock_http(handler)
+
+        canceller = asyncio.create_task(_cancel_when_sub0_in_flight())
+        urls, zip_path = await scrape_site(
+            "https://example.com/", "trk_cancel", "job_cancel", usage=None
+        )
+        await canceller
         try:
-            urls, zip_path = await scrape_site(
-                "https://example.com/", "trk_cancel", "job_cancel", usage=None
-            )
-            try:
-                # All 3 sub URLs are returned as the link list, but not all were processed
-                assert len(urls) == 4  # original + 3 sub
-            finally:
-                Path(zip_path).unlink(missing_ok=True)
-        except ValueError:
-            # If cancellation prevents any successful content, create_zip_file raises.
-            # That's an acceptable outcome for this branch — the cancel path was still hit.
-            pass
+            assert urls == ["https://example.com/"] + sub_urls
+            assert jina_requests == [
+                "https://r.jina.ai/https://example.com/",
+                "https://r.jina.ai/https://example.com/sub0",
+            ]
+            state = await fresh_tracker.get("trk_cancel")
+            assert state["cancelled"] is True
+            assert state["total"] == 4
+            assert state["processed"] == 4
+            # Only the seed page made it; the in-flight and queued fetches were
+            # cancelled, which counts them as skipped rather than failed
+            assert state["potential_successful"] == 1
+            assert state["successful"] == 1
+            assert state["skipped"] == 3
+            assert state["failed"] == 0
+        finally:
+            Path(zip_path).unlink(missing_ok=True)
 
     async def test_scrape_site_handles_exception_from_task(
-        self, monkeypatch, fresh_tracker, fast_limiter, caplog
+        self, monkeypatch, fresh_tracker, fast_limiter, mock_http, caplog
     ):
-        """An exception from a batch task must be logged and counted as failed (lines 231-233)."""
+        """An exception from a fetch task must be logged and counted as failed."""
         import logging
         from link_content_scraper import scraper as scraper_module
 
         monkeypatch.setattr(scraper_module, "progress_tracker", fresh_tracker)
         monkeypatch.setattr(scraper_module, "rate_limiter", fast_limiter)
-        monkeypatch.setattr(scraper_module, "BATCH_SIZE", 5)
-        monkeypatch.setattr(scraper_module, "RATE_PERIOD", 0)
 
         sub_urls = ["https://example.com/sub0", "https://example.com/sub1"]
 
@@ -583,17 +880,7 @@ class TestScrapeSite:
                 return httpx.Response(200, text=_index_page(sub_urls))
             return httpx.Response(200, text=JINA_VALID_RESPONSE)
 
-        transport = httpx.MockTransport(handler)
-
-        import httpx as httpx_mod
-        original = httpx_mod.AsyncClient
-
-        class _Patched(original):
-            def __init__(self, *args, **kwargs):
-                kwargs["transport"] = transport
-                super().__init__(*args, **kwargs)
-
-        monkeypatch.setattr(scraper_module.httpx, "AsyncClient", _Patched)
+        mock_http(handler)
 
         # Patch get_markdown_content so the first sub URL raises a regular Exception
         # — gather(return_exceptions=True) collects it, then the dispatch loop